@@ -0,0 +1,22 @@
+"""Optional mypyc build of the hot modules.
+
+Set SCPI_CORE_USE_MYPYC=1 (with mypy installed) to compile
+scpi_core.transport and scpi_core.device to C extensions. Without it the
+package installs as pure Python.
+"""
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("SCPI_CORE_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(
+        [
+            "src/scpi_core/transport.py",
+            "src/scpi_core/device.py",
+        ]
+    )
+
+setup(ext_modules=ext_modules)
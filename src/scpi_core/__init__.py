@@ -1,18 +1,26 @@
 from .transport import Transport, TcpTransport
 from .device import ScpiDevice
+from .pool import TcpTransportPool
+from .fanout import broadcast
+from .async_transport import AsyncTcpTransport
+from .async_device import AsyncScpiDevice
 from .errors import ScpiError, ScpiConnectionError, ScpiTimeoutError, ScpiProtocolError
 
 # Serial transport is optional (requires pyserial)
 try:
     from .serial_transport import SerialTransport
 except ImportError:
-    SerialTransport = None
+    SerialTransport = None  # type: ignore[misc,assignment]
 
 __all__ = [
     "Transport",
     "TcpTransport",
     "SerialTransport",
     "ScpiDevice",
+    "TcpTransportPool",
+    "broadcast",
+    "AsyncTcpTransport",
+    "AsyncScpiDevice",
     "ScpiError",
     "ScpiConnectionError",
     "ScpiTimeoutError",
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from .async_transport import AsyncTcpTransport
+from .errors import ScpiProtocolError
+
+
+class AsyncScpiDevice:
+    """asyncio counterpart of ScpiDevice built on an AsyncTcpTransport.
+
+    Queries to independent instruments can be overlapped with
+    asyncio.gather() instead of paying each round-trip in turn.
+    """
+
+    def __init__(self, transport: AsyncTcpTransport):
+        self._transport = transport
+
+    @property
+    def transport(self) -> AsyncTcpTransport:
+        return self._transport
+
+    # -- Connection lifecycle --
+
+    async def connect(self):
+        await self._transport.connect()
+
+    async def disconnect(self):
+        await self._transport.disconnect()
+
+    def is_connected(self) -> bool:
+        return self._transport.is_connected()
+
+    async def __aenter__(self):
+        if not self._transport.is_connected():
+            await self._transport.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.disconnect()
+        return False
+
+    # -- Core SCPI operations --
+
+    async def command(self, cmd: str) -> None:
+        """Send a command (no response expected)."""
+        await self._transport.send(cmd)
+
+    async def query(self, cmd: str, timeout: float | None = None) -> str:
+        """Send a query and return the response string."""
+        await self._transport.send(cmd)
+        return await self._transport.receive(timeout=timeout)
+
+    async def query_float(self, cmd: str, timeout: float | None = None) -> float:
+        """Send a query and parse the response as a float."""
+        resp = await self.query(cmd, timeout=timeout)
+        try:
+            return float(resp)
+        except ValueError:
+            raise ScpiProtocolError(f"Expected float, got {resp!r} for {cmd!r}")
+
+    async def query_int(self, cmd: str, timeout: float | None = None) -> int:
+        """Send a query and parse the response as an integer."""
+        resp = await self.query(cmd, timeout=timeout)
+        try:
+            return int(resp)
+        except ValueError:
+            raise ScpiProtocolError(f"Expected int, got {resp!r} for {cmd!r}")
+
+    async def query_bool(self, cmd: str, timeout: float | None = None) -> bool:
+        """Send a query and parse 0/1 or OFF/ON response as bool."""
+        resp = (await self.query(cmd, timeout=timeout)).strip().upper()
+        if resp in ("1", "ON"):
+            return True
+        if resp in ("0", "OFF"):
+            return False
+        raise ScpiProtocolError(f"Expected boolean, got {resp!r} for {cmd!r}")
+
+    async def query_raw(
+        self, cmd: str, count: int, timeout: float | None = None
+    ) -> bytes:
+        """Send a query and read a fixed number of raw bytes."""
+        await self._transport.send(cmd)
+        return await self._transport.receive_raw(count, timeout=timeout)
+
+    # -- IEEE 488.2 common commands --
+
+    async def idn(self) -> str:
+        """Query instrument identity (*IDN?)."""
+        return await self.query("*IDN?")
+
+    async def reset(self) -> None:
+        """Reset instrument to factory defaults (*RST)."""
+        await self.command("*RST")
+
+    async def clear_status(self) -> None:
+        """Clear status registers (*CLS)."""
+        await self.command("*CLS")
+
+    async def opc(self) -> bool:
+        """Query operation complete (*OPC?)."""
+        return (await self.query("*OPC?")).strip() == "1"
+
+    async def wait(self) -> None:
+        """Wait for pending operations to complete (*WAI)."""
+        await self.command("*WAI")
+
+    async def self_test(self) -> int:
+        """Run self-test and return result (*TST?). 0 = pass."""
+        return await self.query_int("*TST?")
+
+    async def save_state(self, slot: int) -> None:
+        """Save instrument state to internal memory (*SAV)."""
+        await self.command(f"*SAV {slot}")
+
+    async def recall_state(self, slot: int) -> None:
+        """Recall instrument state from internal memory (*RCL)."""
+        await self.command(f"*RCL {slot}")
+
+    async def check_error(self) -> str | None:
+        """Query system error queue. Returns None if no error."""
+        resp = await self.query(":SYST:ERR?")
+        if resp.startswith("0,") or resp.startswith("+0,"):
+            return None
+        return resp
@@ -0,0 +1,135 @@
+"""asyncio TCP transport for SCPI instruments.
+
+Lets several instruments be queried concurrently from one event loop,
+e.g. with asyncio.gather(). On Linux, installing uvloop and calling
+asyncio.set_event_loop_policy(uvloop.EventLoopPolicy()) before starting
+the loop further reduces per-query latency.
+"""
+from __future__ import annotations
+
+import asyncio
+
+from .errors import ScpiConnectionError, ScpiProtocolError, ScpiTimeoutError
+
+# Upper bound on a single newline-terminated response (ASCII waveform dumps
+# can be several MB).
+_STREAM_LIMIT = 1 << 24
+
+
+class AsyncTcpTransport:
+    """SCPI over TCP sockets using asyncio streams."""
+
+    def __init__(self, host: str, port: int = 5555, timeout: float = 5.0):
+        self._host = host
+        self._port = port
+        self._timeout = timeout
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    @property
+    def host(self) -> str:
+        return self._host
+
+    @property
+    def port(self) -> int:
+        return self._port
+
+    @property
+    def timeout(self) -> float:
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value: float):
+        self._timeout = value
+
+    async def connect(self):
+        if self._writer is not None:
+            return
+        try:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(
+                    self._host, self._port, limit=_STREAM_LIMIT
+                ),
+                self._timeout,
+            )
+        except asyncio.TimeoutError as e:
+            raise ScpiConnectionError(
+                f"Timeout connecting to {self._host}:{self._port}"
+            ) from e
+        except OSError as e:
+            raise ScpiConnectionError(
+                f"Cannot connect to {self._host}:{self._port}: {e}"
+            ) from e
+
+    async def disconnect(self):
+        if self._writer is not None:
+            writer = self._writer
+            self._reader = None
+            self._writer = None
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    def _abort(self) -> None:
+        """Close a broken connection without waiting for it to shut down."""
+        writer = self._writer
+        self._reader = None
+        self._writer = None
+        if writer is not None:
+            writer.close()
+
+    def is_connected(self) -> bool:
+        return self._writer is not None
+
+    async def send(self, data: str) -> None:
+        payload = data if data.endswith("\n") else data + "\n"
+        await self.send_raw(payload.encode("ascii"))
+
+    async def send_raw(self, data: bytes) -> None:
+        if self._writer is None:
+            raise ScpiConnectionError("Not connected")
+        try:
+            self._writer.write(data)
+            await asyncio.wait_for(self._writer.drain(), self._timeout)
+        except asyncio.TimeoutError as e:
+            raise ScpiTimeoutError("Timeout sending data") from e
+        except OSError as e:
+            self._abort()
+            raise ScpiConnectionError(f"Send failed: {e}") from e
+
+    async def receive(self, timeout: float | None = None) -> str:
+        if self._reader is None:
+            raise ScpiConnectionError("Not connected")
+        try:
+            line = await asyncio.wait_for(
+                self._reader.readuntil(b"\n"),
+                self._timeout if timeout is None else timeout,
+            )
+        except asyncio.TimeoutError as e:
+            raise ScpiTimeoutError("Timeout waiting for response") from e
+        except asyncio.IncompleteReadError as e:
+            raise ScpiConnectionError("Connection closed by instrument") from e
+        except asyncio.LimitOverrunError as e:
+            raise ScpiProtocolError("Response exceeds stream buffer limit") from e
+        except OSError as e:
+            self._abort()
+            raise ScpiConnectionError(f"Receive failed: {e}") from e
+        return line.decode("ascii", errors="replace").strip()
+
+    async def receive_raw(self, count: int, timeout: float | None = None) -> bytes:
+        if self._reader is None:
+            raise ScpiConnectionError("Not connected")
+        try:
+            return await asyncio.wait_for(
+                self._reader.readexactly(count),
+                self._timeout if timeout is None else timeout,
+            )
+        except asyncio.TimeoutError as e:
+            raise ScpiTimeoutError(f"Timeout reading {count} raw bytes") from e
+        except asyncio.IncompleteReadError as e:
+            raise ScpiConnectionError("Connection closed by instrument") from e
+        except OSError as e:
+            self._abort()
+            raise ScpiConnectionError(f"Raw receive failed: {e}") from e
@@ -1,8 +1,35 @@
 from __future__ import annotations
 
-from .transport import Transport
+import functools
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Literal
+
+from .transport import TcpTransport, Transport
+from .pool import TcpTransportPool, default_pool
 from .errors import ScpiProtocolError, ScpiTimeoutError
 
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+# Boolean responses looked up directly on the raw bytes; other spellings
+# fall back to an upper-cased lookup.
+_BOOL_RESPONSES = {
+    b"1": True,
+    b"ON": True,
+    b"TRUE": True,
+    b"0": False,
+    b"OFF": False,
+    b"FALSE": False,
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _encode(cmd: str) -> bytes:
+    # Hot polling commands (*OPC?, *STB?, :MEAS:...?) repeat constantly; keep
+    # their encoded form around. The transport appends its own terminator.
+    return cmd.encode("ascii")
+
 
 class ScpiDevice:
     """High-level SCPI instrument interface built on a Transport.
@@ -10,76 +37,200 @@ class ScpiDevice:
     Provides command(), query(), and common IEEE 488.2 operations.
     """
 
+    __slots__ = ("_transport", "_pool")
+
     def __init__(self, transport: Transport, auto_connect: bool = True):
         self._transport = transport
+        self._pool: TcpTransportPool | None = None
         if auto_connect and not transport.is_connected():
             transport.connect()
 
+    @classmethod
+    def from_pool(
+        cls,
+        host: str,
+        port: int = 5555,
+        timeout: float = 5.0,
+        pool: TcpTransportPool | None = None,
+    ) -> ScpiDevice:
+        """Create a device on a pooled TcpTransport.
+
+        Leaving the ``with`` block without an exception returns the
+        connection to the pool instead of closing it.
+        """
+        if pool is None:
+            pool = default_pool
+        dev = cls(pool.get(host, port, timeout), auto_connect=False)
+        dev._pool = pool
+        return dev
+
     @property
     def transport(self) -> Transport:
         return self._transport
 
     # -- Connection lifecycle --
 
-    def connect(self):
+    def connect(self) -> None:
         self._transport.connect()
 
-    def disconnect(self):
+    def disconnect(self) -> None:
         self._transport.disconnect()
 
     def is_connected(self) -> bool:
         return self._transport.is_connected()
 
-    def __enter__(self):
+    def __enter__(self) -> ScpiDevice:
         if not self._transport.is_connected():
             self._transport.connect()
         return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.disconnect()
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> Literal[False]:
+        # A session that failed may have a late response in flight, so only
+        # hand clean connections back to the pool.
+        transport = self._transport
+        if (
+            self._pool is not None
+            and exc_type is None
+            and isinstance(transport, TcpTransport)
+        ):
+            self._pool.release(transport)
+        else:
+            self.disconnect()
         return False
 
     # -- Core SCPI operations --
 
     def command(self, cmd: str) -> None:
         """Send a command (no response expected)."""
-        self._transport.send(cmd)
+        self._transport.send_bytes(_encode(cmd))
 
     def query(self, cmd: str, timeout: float | None = None) -> str:
         """Send a query and return the response string."""
-        self._transport.send(cmd)
+        self._transport.send_bytes(_encode(cmd))
         return self._transport.receive(timeout=timeout)
 
+    def commands(self, cmds: Iterable[str]) -> None:
+        """Send several commands in one transport write."""
+        self._transport.send_many(cmds)
+
+    def compile_command(self, template: str) -> Callable[..., None]:
+        """Return a function that sends ``template % args`` as a command.
+
+        The template is encoded once and uses bytes printf-style placeholders
+        (``%d``, ``%g``; ``%s`` takes bytes), e.g.
+        ``set_scale = dev.compile_command(":CHAN%d:SCAL %g")``.
+        """
+        tmpl = template.encode("ascii")
+        send_bytes = self._transport.send_bytes
+
+        def send(*args: Any) -> None:
+            send_bytes(tmpl % args)
+
+        return send
+
+    def pipeline(
+        self, queries: Iterable[str], timeout: float | None = None
+    ) -> list[str]:
+        """Send several queries in one write, then read one response per query."""
+        queries = list(queries)
+        self._transport.send_many(queries)
+        return [self._transport.receive(timeout=timeout) for _ in queries]
+
+    def _query_bytes(self, cmd: str, timeout: float | None = None) -> bytes:
+        self._transport.send_bytes(_encode(cmd))
+        return self._transport.receive_bytes(timeout=timeout)
+
     def query_float(self, cmd: str, timeout: float | None = None) -> float:
         """Send a query and parse the response as a float."""
-        resp = self.query(cmd, timeout=timeout)
+        resp = self._query_bytes(cmd, timeout=timeout)
         try:
             return float(resp)
         except ValueError:
-            raise ScpiProtocolError(f"Expected float, got {resp!r} for {cmd!r}")
+            raise ScpiProtocolError(
+                f"Expected float, got {resp.decode('ascii', 'replace')!r} for {cmd!r}"
+            )
 
     def query_int(self, cmd: str, timeout: float | None = None) -> int:
         """Send a query and parse the response as an integer."""
-        resp = self.query(cmd, timeout=timeout)
+        resp = self._query_bytes(cmd, timeout=timeout)
         try:
             return int(resp)
         except ValueError:
-            raise ScpiProtocolError(f"Expected int, got {resp!r} for {cmd!r}")
+            raise ScpiProtocolError(
+                f"Expected int, got {resp.decode('ascii', 'replace')!r} for {cmd!r}"
+            )
 
     def query_bool(self, cmd: str, timeout: float | None = None) -> bool:
-        """Send a query and parse 0/1 or OFF/ON response as bool."""
-        resp = self.query(cmd, timeout=timeout).strip().upper()
-        if resp in ("1", "ON"):
-            return True
-        if resp in ("0", "OFF"):
-            return False
-        raise ScpiProtocolError(f"Expected boolean, got {resp!r} for {cmd!r}")
+        """Send a query and parse 0/1, OFF/ON or FALSE/TRUE response as bool."""
+        resp = self._query_bytes(cmd, timeout=timeout)
+        value = _BOOL_RESPONSES.get(resp)
+        if value is None:
+            value = _BOOL_RESPONSES.get(resp.upper())
+            if value is None:
+                raise ScpiProtocolError(
+                    f"Expected boolean, got {resp.decode('ascii', 'replace')!r} "
+                    f"for {cmd!r}"
+                )
+        return value
 
     def query_raw(self, cmd: str, count: int, timeout: float | None = None) -> bytes:
         """Send a query and read a fixed number of raw bytes."""
-        self._transport.send(cmd)
+        self._transport.send_bytes(_encode(cmd))
         return self._transport.receive_raw(count, timeout=timeout)
 
+    def query_block(
+        self, cmd: str, dtype: npt.DTypeLike = "u1", timeout: float | None = None
+    ) -> np.ndarray:
+        """Send a query and read an IEEE 488.2 definite-length block.
+
+        Parses the ``#<n><length>`` header and reads the payload directly into
+        a NumPy array of ``dtype`` (e.g. ``">i2"`` for big-endian 16-bit
+        samples).
+        Requires numpy: pip install scpi-core[numpy]
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError(
+                "numpy is required for query_block. "
+                "Install with: pip install scpi-core[numpy]"
+            ) from None
+        self._transport.send_bytes(_encode(cmd))
+        length = self._read_block_header(cmd, timeout)
+        # Receive straight into the array's memory; reinterpret it as dtype
+        # once the whole block (and its terminator) has been consumed.
+        data = np.empty(length, dtype=np.uint8)
+        self._transport.receive_into(data.data, length, timeout=timeout)
+        self._transport.receive(timeout=timeout)
+        try:
+            return data.view(dtype)
+        except ValueError as e:
+            raise ScpiProtocolError(
+                f"Block of {length} bytes does not fit dtype {dtype!r} "
+                f"for {cmd!r}: {e}"
+            ) from e
+
+    def _read_block_header(self, cmd: str, timeout: float | None) -> int:
+        head = self._transport.receive_raw(2, timeout=timeout)
+        while head[:1].isspace():
+            head = head[1:] + self._transport.receive_raw(1, timeout=timeout)
+        if head[:1] != b"#" or not head[1:2].isdigit() or head[1:2] == b"0":
+            raise ScpiProtocolError(
+                f"Expected definite-length block header, got {head!r} for {cmd!r}"
+            )
+        digits = self._transport.receive_raw(int(head[1:2]), timeout=timeout)
+        try:
+            return int(digits)
+        except ValueError:
+            raise ScpiProtocolError(
+                f"Malformed block length {digits!r} for {cmd!r}"
+            ) from None
+
     # -- IEEE 488.2 common commands --
 
     def idn(self) -> str:
@@ -96,7 +247,7 @@ class ScpiDevice:
 
     def opc(self) -> bool:
         """Query operation complete (*OPC?)."""
-        return self.query("*OPC?").strip() == "1"
+        return self._query_bytes("*OPC?") == b"1"
 
     def wait(self) -> None:
         """Wait for pending operations to complete (*WAI)."""
@@ -106,17 +257,17 @@ class ScpiDevice:
         """Run self-test and return result (*TST?). 0 = pass."""
         return self.query_int("*TST?")
 
-    def save_state(self, slot: int) -> None:
+    def save_state(self, slot: int | str) -> None:
         """Save instrument state to internal memory (*SAV)."""
-        self.command(f"*SAV {slot}")
+        self._transport.send_bytes(b"*SAV %d" % int(slot))
 
-    def recall_state(self, slot: int) -> None:
+    def recall_state(self, slot: int | str) -> None:
         """Recall instrument state from internal memory (*RCL)."""
-        self.command(f"*RCL {slot}")
+        self._transport.send_bytes(b"*RCL %d" % int(slot))
 
     def check_error(self) -> str | None:
         """Query system error queue. Returns None if no error."""
-        resp = self.query(":SYST:ERR?")
-        if resp.startswith("0,") or resp.startswith("+0,"):
+        resp = self._query_bytes(":SYST:ERR?")
+        if resp.lstrip(b"+").startswith(b"0,"):
             return None
-        return resp
+        return resp.decode("ascii", errors="replace")
@@ -0,0 +1,112 @@
+"""Send one query to many instruments and collect the answers concurrently."""
+from __future__ import annotations
+
+import selectors
+import socket
+import time
+from typing import Iterable, cast
+
+from .device import ScpiDevice, _encode
+from .errors import ScpiConnectionError, ScpiTimeoutError
+from .transport import TcpTransport
+
+
+def broadcast(
+    devices: Iterable[ScpiDevice], cmd: str, timeout: float | None = None
+) -> list[str]:
+    """Send ``cmd`` to every device and return their responses in order.
+
+    Queries to TCP instruments are all sent up front and the responses are
+    collected with a selector as they arrive, so the total time is roughly
+    one round-trip instead of one per instrument. Devices on other
+    transports are queried one by one while the TCP responses are in
+    flight. ``timeout`` bounds the whole call; without it each non-TCP
+    device uses its own timeout and the TCP responses must arrive within
+    the largest TCP transport timeout, measured from the start of the call.
+
+    Each TCP transport may appear only once, since its responses could not
+    be told apart.
+    """
+    start = time.monotonic()
+    devices = list(devices)
+    results: list[str | None] = [None] * len(devices)
+    payload = _encode(cmd)
+    pending: list[tuple[int, TcpTransport]] = []
+    others: list[int] = []
+
+    seen: set[int] = set()
+    for i, dev in enumerate(devices):
+        transport = dev.transport
+        if isinstance(transport, TcpTransport):
+            if id(transport) in seen:
+                raise ValueError(
+                    f"broadcast() got the same TcpTransport for more than one "
+                    f"device ({transport.host}:{transport.port})"
+                )
+            seen.add(id(transport))
+            pending.append((i, transport))
+        else:
+            others.append(i)
+
+    for _, transport in pending:
+        transport.send_bytes(payload)
+
+    for i in others:
+        remaining = None
+        if timeout is not None:
+            remaining = start + timeout - time.monotonic()
+            if remaining <= 0:
+                raise ScpiTimeoutError("Timeout waiting for broadcast responses")
+        results[i] = devices[i].query(cmd, timeout=remaining)
+
+    if pending:
+        if timeout is None:
+            timeout = max(transport.timeout for _, transport in pending)
+        _collect(pending, results, start + timeout)
+
+    # Every slot is filled unless an exception was raised above.
+    return cast("list[str]", results)
+
+
+def _collect(
+    pending: list[tuple[int, TcpTransport]],
+    results: list[str | None],
+    deadline: float,
+) -> None:
+    sel = selectors.DefaultSelector()
+    try:
+        for i, transport in pending:
+            line = transport._pop_line()
+            if line is not None:
+                results[i] = line.decode("ascii", errors="replace").strip()
+            elif transport._socket is not None:
+                sel.register(
+                    transport._socket, selectors.EVENT_READ, (i, transport)
+                )
+            else:
+                raise ScpiConnectionError("Not connected")
+
+        while sel.get_map():
+            # Always poll once, so responses that arrived while slower
+            # devices were being queried are still collected.
+            remaining = max(0.0, deadline - time.monotonic())
+            events = sel.select(remaining)
+            if not events and time.monotonic() >= deadline:
+                raise ScpiTimeoutError(
+                    f"Timeout waiting for {len(sel.get_map())} of "
+                    f"{len(pending)} broadcast responses"
+                )
+            for key, _ in events:
+                i, transport = key.data
+                sock: socket.socket = key.fileobj  # type: ignore[assignment]
+                try:
+                    transport._recv_chunk(sock)
+                except OSError as e:
+                    transport.disconnect()
+                    raise ScpiConnectionError(f"Receive failed: {e}") from e
+                line = transport._pop_line()
+                if line is not None:
+                    results[i] = line.decode("ascii", errors="replace").strip()
+                    sel.unregister(sock)
+    finally:
+        sel.close()
@@ -0,0 +1,99 @@
+"""Keep-alive pool of connected TcpTransports.
+
+Reusing a connection skips the TCP handshake for scripts and tests that open
+many short sessions to the same instrument. Do not pool instruments behind a
+shared bus bridge (e.g. LAN-to-GPIB gateways), where a held-open connection
+can block other controllers.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+
+from .transport import TcpTransport
+
+
+class TcpTransportPool:
+    """Hands out connected TcpTransports keyed by (host, port).
+
+    Released transports stay connected for up to ``idle_ttl`` seconds; a
+    background thread closes the ones that sit idle longer.
+    """
+
+    def __init__(self, idle_ttl: float = 30.0):
+        self._idle_ttl = idle_ttl
+        self._idle: dict[tuple[str, int], deque[tuple[TcpTransport, float]]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._reaper: threading.Thread | None = None
+
+    @property
+    def idle_ttl(self) -> float:
+        return self._idle_ttl
+
+    def get(self, host: str, port: int = 5555, timeout: float = 5.0) -> TcpTransport:
+        """Return a connected transport, reusing an idle one when available."""
+        now = time.monotonic()
+        with self._lock:
+            idle = self._idle.get((host, port))
+            while idle:
+                transport, since = idle.pop()
+                if transport.is_connected() and now - since < self._idle_ttl:
+                    # Instruments drop idle LAN sessions; flush_input() does a
+                    # non-blocking read and disconnects if the peer closed.
+                    transport.flush_input()
+                    if transport.is_connected():
+                        if transport.timeout != timeout:
+                            transport.timeout = timeout
+                        return transport
+                transport.disconnect()
+        transport = TcpTransport(host, port, timeout=timeout)
+        transport.connect()
+        return transport
+
+    def release(self, transport: TcpTransport) -> None:
+        """Return a transport to the pool instead of disconnecting it."""
+        transport.flush_input()
+        if not transport.is_connected():
+            return
+        with self._lock:
+            if self._stop.is_set():
+                transport.disconnect()
+                return
+            key = (transport.host, transport.port)
+            self._idle.setdefault(key, deque()).append(
+                (transport, time.monotonic())
+            )
+            if self._reaper is None:
+                self._reaper = threading.Thread(
+                    target=self._reap_loop, name="scpi-pool-reaper", daemon=True
+                )
+                self._reaper.start()
+
+    def reap(self) -> None:
+        """Disconnect transports that have been idle longer than idle_ttl."""
+        cutoff = time.monotonic() - self._idle_ttl
+        with self._lock:
+            for key in list(self._idle):
+                idle = self._idle[key]
+                while idle and idle[0][1] <= cutoff:
+                    idle.popleft()[0].disconnect()
+                if not idle:
+                    del self._idle[key]
+
+    def close(self) -> None:
+        """Disconnect every idle transport and stop the reaper thread."""
+        self._stop.set()
+        with self._lock:
+            for idle in self._idle.values():
+                for transport, _ in idle:
+                    transport.disconnect()
+            self._idle.clear()
+
+    def _reap_loop(self) -> None:
+        while not self._stop.wait(self._idle_ttl):
+            self.reap()
+
+
+default_pool = TcpTransportPool()
@@ -4,6 +4,13 @@ Requires pyserial: pip install scpi-core[serial]
 """
 from __future__ import annotations
 
+import os
+import queue
+import sys
+import threading
+import time
+from typing import Iterable
+
 try:
     import serial
 except ImportError:
@@ -12,16 +19,41 @@ except ImportError:
 from .transport import Transport
 from .errors import ScpiConnectionError, ScpiTimeoutError
 
+# Linux exposes the FTDI USB latency timer (ms) per tty under this directory.
+_USB_SERIAL_SYSFS = "/sys/bus/usb-serial/devices"
+
+# Fraction of a call's timeout that a blocking line read may overrun before
+# the port timeout is shrunk to fit; every change reconfigures the port.
+_TIMEOUT_SLACK = 0.1
+
 
 class SerialTransport(Transport):
     """SCPI over serial port (USB-CDC, RS-232, virtual COM ports)."""
 
+    __slots__ = (
+        "_port",
+        "_baudrate",
+        "_timeout",
+        "_current_timeout",
+        "_terminator",
+        "_term",
+        "_low_latency",
+        "_serial",
+        "_rxbuf",
+        "_threaded",
+        "_reader",
+        "_bytes_q",
+        "_stop",
+    )
+
     def __init__(
         self,
         port: str,
         baudrate: int = 115200,
         timeout: float = 5.0,
         terminator: str = "\n",
+        low_latency: bool = True,
+        threaded: bool = False,
     ):
         if serial is None:
             raise ImportError(
@@ -31,8 +63,21 @@ class SerialTransport(Transport):
         self._port = port
         self._baudrate = baudrate
         self._timeout = timeout
+        # Timeout currently applied to the port; changing it reconfigures the
+        # device, so only do so when the value actually differs.
+        self._current_timeout = timeout
         self._terminator = terminator
+        self._term = terminator.encode("ascii")
+        self._low_latency = low_latency
         self._serial: "serial.Serial | None" = None
+        # Bytes read past the end of the last response.
+        self._rxbuf = bytearray()
+        # Optional background reader that keeps draining the port so the
+        # driver's buffer cannot overflow at high baud rates.
+        self._threaded = threaded
+        self._reader: threading.Thread | None = None
+        self._bytes_q: queue.SimpleQueue[bytes | Exception] | None = None
+        self._stop = threading.Event()
 
     @property
     def port(self) -> str:
@@ -51,6 +96,7 @@ class SerialTransport(Transport):
         self._timeout = value
         if self._serial is not None:
             self._serial.timeout = value
+            self._current_timeout = value
 
     def connect(self):
         if self._serial is not None:
@@ -61,28 +107,103 @@ class SerialTransport(Transport):
                 baudrate=self._baudrate,
                 timeout=self._timeout,
             )
+            self._current_timeout = self._timeout
         except serial.SerialException as e:
             raise ScpiConnectionError(
                 f"Cannot open serial port {self._port}: {e}"
             ) from e
+        self._rxbuf.clear()
+        if self._low_latency:
+            self._enable_low_latency(self._serial)
+        if self._threaded:
+            self._stop = threading.Event()
+            self._bytes_q = queue.SimpleQueue()
+            self._reader = threading.Thread(
+                target=self._drain_loop,
+                args=(self._serial, self._bytes_q, self._stop),
+                name=f"scpi-serial-reader-{self._port}",
+                daemon=True,
+            )
+            self._reader.start()
+
+    @staticmethod
+    def _drain_loop(
+        port: serial.Serial,
+        bytes_q: queue.SimpleQueue[bytes | Exception],
+        stop: threading.Event,
+    ) -> None:
+        while not stop.is_set():
+            try:
+                chunk = port.read(max(1, port.in_waiting))
+            except Exception as e:
+                # Closing the port from disconnect() lands here too.
+                if not stop.is_set():
+                    bytes_q.put(e)
+                return
+            if chunk:
+                bytes_q.put(chunk)
+
+    def _enable_low_latency(self, port: serial.Serial) -> None:
+        # FTDI adapters batch received bytes for up to 16 ms by default, which
+        # puts a floor under every query. All steps are best effort: they
+        # depend on the platform, the driver and file permissions.
+        try:
+            port.set_low_latency_mode(True)
+        except (AttributeError, NotImplementedError, ValueError, OSError):
+            pass
+        if sys.platform.startswith("linux"):
+            tty = os.path.basename(os.path.realpath(self._port))
+            path = os.path.join(_USB_SERIAL_SYSFS, tty, "latency_timer")
+            try:
+                with open(path, "w") as f:
+                    f.write("1")
+            except OSError:
+                pass
+        elif sys.platform == "win32":
+            try:
+                port.set_buffer_size(rx_size=65536, tx_size=65536)
+            except (AttributeError, ValueError, serial.SerialException):
+                pass
+
+    def _apply_timeout(self, port: serial.Serial, timeout: float | None) -> None:
+        """Set the read timeout for the next operation if it differs.
+
+        A per-call timeout only applies to that call: the next call without
+        one switches the port back to the transport's default timeout.
+        """
+        if timeout is None:
+            timeout = self._timeout
+        if timeout != self._current_timeout:
+            port.timeout = timeout
+            self._current_timeout = timeout
 
     def disconnect(self):
+        self._stop.set()
         if self._serial is not None:
             try:
                 self._serial.close()
             except serial.SerialException:
                 pass
             self._serial = None
+        if self._reader is not None:
+            self._reader.join(timeout=self._timeout)
+            self._reader = None
+        self._bytes_q = None
+        self._rxbuf.clear()
 
     def is_connected(self) -> bool:
         return self._serial is not None and self._serial.is_open
 
     def send(self, data: str) -> None:
+        self.send_bytes(data.encode("ascii"))
+
+    def send_bytes(self, data: bytes) -> None:
         if self._serial is None:
             raise ScpiConnectionError("Not connected")
-        payload = data if data.endswith(self._terminator) else data + self._terminator
+        if not data.endswith(self._term):
+            data += self._term
         try:
-            self._serial.write(payload.encode("ascii"))
+            self._serial.write(data)
         except serial.SerialException as e:
             raise ScpiConnectionError(f"Serial write failed: {e}") from e
 
@@ -94,43 +215,114 @@ class SerialTransport(Transport):
         except serial.SerialException as e:
             raise ScpiConnectionError(f"Serial raw write failed: {e}") from e
 
+    def send_many(self, commands: Iterable[str]) -> None:
+        """Send several commands with a single write()."""
+        term = self._terminator
+        payload = "".join(c if c.endswith(term) else c + term for c in commands)
+        if payload:
+            self.send_raw(payload.encode("ascii"))
+
     def receive(self, timeout: float | None = None) -> str:
+        return self.receive_bytes(timeout).decode("ascii", errors="replace")
+
+    def receive_bytes(self, timeout: float | None = None) -> bytes:
         if self._serial is None:
             raise ScpiConnectionError("Not connected")
-        prev_timeout = self._serial.timeout
-        if timeout is not None:
-            self._serial.timeout = timeout
+        if timeout is None:
+            timeout = self._timeout
+        if self._bytes_q is None:
+            self._apply_timeout(self._serial, timeout)
         try:
-            line = self._serial.readline()
-            if not line:
-                raise ScpiTimeoutError("No response from serial instrument")
-            return line.decode("ascii", errors="replace").strip()
+            return self._consume_line(self._serial, timeout).strip()
         except serial.SerialException as e:
             raise ScpiConnectionError(f"Serial read failed: {e}") from e
-        finally:
-            if timeout is not None and self._serial is not None:
-                self._serial.timeout = prev_timeout
 
     def receive_raw(self, count: int, timeout: float | None = None) -> bytes:
         if self._serial is None:
             raise ScpiConnectionError("Not connected")
-        prev_timeout = self._serial.timeout
-        if timeout is not None:
-            self._serial.timeout = timeout
+        if timeout is None:
+            timeout = self._timeout
+        rxbuf = self._rxbuf
         try:
-            data = self._serial.read(count)
-            if len(data) < count:
-                raise ScpiTimeoutError(
-                    f"Serial read: expected {count} bytes, got {len(data)}"
-                )
-            return bytes(data)
+            if self._bytes_q is not None:
+                deadline = time.monotonic() + timeout
+                while len(rxbuf) < count:
+                    chunk = self._next_chunk(self._serial, deadline)
+                    if not chunk:
+                        break
+                    rxbuf += chunk
+            elif len(rxbuf) < count:
+                self._apply_timeout(self._serial, timeout)
+                rxbuf += self._serial.read(count - len(rxbuf))
         except serial.SerialException as e:
             raise ScpiConnectionError(f"Serial raw read failed: {e}") from e
-        finally:
-            if timeout is not None and self._serial is not None:
-                self._serial.timeout = prev_timeout
+        if len(rxbuf) < count:
+            raise ScpiTimeoutError(
+                f"Serial read: expected {count} bytes, got {len(rxbuf)}"
+            )
+        data = bytes(rxbuf[:count])
+        del rxbuf[:count]
+        return data
+
+    def _consume_line(self, port: serial.Serial, timeout: float) -> bytes:
+        """Return the next line (without its newline), reading in bulk.
+
+        Drains whatever the driver has buffered per read() instead of
+        pyserial's byte-at-a-time readline(); bytes after the newline stay
+        in the receive buffer for the next read. ``timeout`` bounds the
+        whole line, not each read.
+        """
+        rxbuf = self._rxbuf
+        scanned = 0
+        deadline = time.monotonic() + timeout
+        slack = timeout * _TIMEOUT_SLACK
+        first = True
+        while True:
+            idx = rxbuf.find(b"\n", scanned)
+            if idx >= 0:
+                line = bytes(rxbuf[:idx])
+                del rxbuf[:idx + 1]
+                return line
+            scanned = len(rxbuf)
+            if not first and self._bytes_q is None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise ScpiTimeoutError("No response from serial instrument")
+                if (
+                    remaining < self._current_timeout - slack
+                    and not port.in_waiting
+                ):
+                    # The next read blocks and would outlive the deadline.
+                    self._apply_timeout(port, remaining)
+            first = False
+            chunk = self._next_chunk(port, deadline)
+            if not chunk:
+                raise ScpiTimeoutError("No response from serial instrument")
+            rxbuf += chunk
+
+    def _next_chunk(self, port: serial.Serial, deadline: float) -> bytes:
+        """Return the next bytes received, or b"" if none arrive in time."""
+        if self._bytes_q is None:
+            return port.read(port.in_waiting or 1)
+        try:
+            item = self._bytes_q.get(timeout=max(0.0, deadline - time.monotonic()))
+        except queue.Empty:
+            return b""
+        if isinstance(item, Exception):
+            # The reader thread has exited; drop the port so later calls fail
+            # fast instead of waiting on a queue nothing will fill.
+            self.disconnect()
+            raise ScpiConnectionError(f"Serial read failed: {item}") from item
+        return item
 
     def flush_input(self) -> None:
         """Discard any unread data in the receive buffer."""
+        self._rxbuf.clear()
         if self._serial is not None:
             self._serial.reset_input_buffer()
+        if self._bytes_q is not None:
+            try:
+                while True:
+                    self._bytes_q.get_nowait()
+            except queue.Empty:
+                pass
@@ -1,51 +1,133 @@
 from __future__ import annotations
 
 import socket
-from abc import ABC, abstractmethod
+from typing import Any, Iterable
 
 from .errors import ScpiConnectionError, ScpiTimeoutError
 
+try:
+    from mypy_extensions import mypyc_attr
+except ImportError:  # only needed when building with mypyc
+    def mypyc_attr(*attrs: Any, **kwattrs: Any) -> Any:  # type: ignore[misc]
+        return lambda cls: cls
 
-class Transport(ABC):
-    """Abstract base for SCPI transports (TCP, serial, USB-TMC, etc.)."""
+_RECV_BUFSIZE = 65536
 
-    @abstractmethod
-    def connect(self):
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class Transport:
+    """Base class for SCPI transports (TCP, serial, USB-TMC, etc.).
+
+    Subclasses must implement connect, disconnect, send, receive and
+    is_connected. This is a plain class rather than an ABC to keep the
+    hot send/receive path and isinstance() checks free of ABC machinery.
+    """
+
+    __slots__ = ()
+
+    def connect(self) -> None:
         """Open the connection."""
+        raise NotImplementedError
 
-    @abstractmethod
-    def disconnect(self):
+    def disconnect(self) -> None:
         """Close the connection."""
+        raise NotImplementedError
 
-    @abstractmethod
     def send(self, data: str) -> None:
         """Send a string to the instrument."""
+        raise NotImplementedError
 
-    @abstractmethod
     def receive(self, timeout: float | None = None) -> str:
         """Read a response string from the instrument."""
+        raise NotImplementedError
 
-    @abstractmethod
     def is_connected(self) -> bool:
         """Return True if the transport is currently connected."""
+        raise NotImplementedError
 
     def send_raw(self, data: bytes) -> None:
         """Send raw bytes. Default implementation encodes via send()."""
         self.send(data.decode("ascii"))
 
+    def send_bytes(self, data: bytes) -> None:
+        """Send an already-encoded command, adding the terminator if missing.
+
+        Default implementation decodes and calls send().
+        """
+        self.send(data.decode("ascii"))
+
+    def send_many(self, commands: Iterable[str]) -> None:
+        """Send several strings. Subclasses may coalesce them into one write."""
+        for cmd in commands:
+            self.send(cmd)
+
+    def receive_bytes(self, timeout: float | None = None) -> bytes:
+        """Read a response as stripped, undecoded bytes.
+
+        Default implementation encodes and strips the result of receive().
+        """
+        return self.receive(timeout=timeout).encode("ascii", errors="replace").strip()
+
     def receive_raw(self, count: int, timeout: float | None = None) -> bytes:
         """Read raw bytes. Subclasses should override for binary data."""
         raise NotImplementedError("This transport does not support raw byte reads")
 
+    def receive_into(
+        self, buf: memoryview, count: int, timeout: float | None = None
+    ) -> int:
+        """Read exactly ``count`` raw bytes into ``buf`` and return ``count``.
+
+        Default implementation copies the result of receive_raw().
+        """
+        data = self.receive_raw(count, timeout=timeout)
+        memoryview(buf).cast("B")[:count] = data
+        return count
+
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class TcpTransport(Transport):
     """SCPI over TCP sockets (LAN/LXI instruments)."""
 
-    def __init__(self, host: str, port: int = 5555, timeout: float = 5.0):
+    __slots__ = (
+        "_host",
+        "_port",
+        "_timeout",
+        "_term",
+        "_current_timeout",
+        "_nodelay",
+        "_rcvbuf",
+        "_sndbuf",
+        "_keepalive",
+        "_socket",
+        "_rxbuf",
+        "_scratch",
+    )
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 5555,
+        timeout: float = 5.0,
+        nodelay: bool = True,
+        rcvbuf: int | None = 1 << 20,
+        sndbuf: int | None = 1 << 18,
+        keepalive: bool = True,
+    ) -> None:
         self._host = host
         self._port = port
         self._timeout = timeout
+        self._term = b"\n"
+        # Timeout currently applied to the socket, tracked to skip redundant
+        # settimeout() calls.
+        self._current_timeout = timeout
+        self._nodelay = nodelay
+        self._rcvbuf = rcvbuf
+        self._sndbuf = sndbuf
+        self._keepalive = keepalive
         self._socket: socket.socket | None = None
+        # Bytes received past the end of the last response (pipelined data).
+        self._rxbuf = bytearray()
+        self._scratch = bytearray(_RECV_BUFSIZE)
 
     @property
     def host(self) -> str:
@@ -60,19 +142,23 @@ class TcpTransport(Transport):
         return self._timeout
 
     @timeout.setter
-    def timeout(self, value: float):
+    def timeout(self, value: float) -> None:
         self._timeout = value
         if self._socket is not None:
             self._socket.settimeout(value)
+            self._current_timeout = value
 
-    def connect(self):
+    def connect(self) -> None:
         if self._socket is not None:
             return
         try:
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             sock.settimeout(self._timeout)
+            self._configure_socket(sock)
             sock.connect((self._host, self._port))
             self._socket = sock
+            self._current_timeout = self._timeout
+            self._rxbuf.clear()
         except socket.timeout as e:
             raise ScpiConnectionError(
                 f"Timeout connecting to {self._host}:{self._port}"
@@ -82,23 +168,54 @@ class TcpTransport(Transport):
                 f"Cannot connect to {self._host}:{self._port}: {e}"
             ) from e
 
-    def disconnect(self):
+    def _apply_timeout(self, sock: socket.socket, timeout: float | None) -> None:
+        """Set the socket timeout for the next operation if it differs.
+
+        A per-call timeout only applies to that call: the next call without
+        one switches the socket back to the transport's default timeout.
+        """
+        if timeout is None:
+            timeout = self._timeout
+        if timeout != self._current_timeout:
+            sock.settimeout(timeout)
+            self._current_timeout = timeout
+
+    def _configure_socket(self, sock: socket.socket) -> None:
+        # Applied before connect() so the receive window is sized during the
+        # handshake. SCPI traffic is small request/response turns, so Nagle
+        # is disabled by default to avoid holding back short commands.
+        if self._nodelay:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if self._rcvbuf is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self._rcvbuf)
+        if self._sndbuf is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self._sndbuf)
+        if self._keepalive:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+    def disconnect(self) -> None:
         if self._socket is not None:
             try:
                 self._socket.close()
             except OSError:
                 pass
             self._socket = None
+        self._rxbuf.clear()
 
     def is_connected(self) -> bool:
         return self._socket is not None
 
     def send(self, data: str) -> None:
+        self.send_bytes(data.encode("ascii"))
+
+    def send_bytes(self, data: bytes) -> None:
         if self._socket is None:
             raise ScpiConnectionError("Not connected")
-        payload = data if data.endswith("\n") else data + "\n"
+        if not data.endswith(self._term):
+            data += self._term
+        self._apply_timeout(self._socket, None)
         try:
-            self._socket.sendall(payload.encode("ascii"))
+            self._socket.sendall(data)
         except socket.timeout as e:
             raise ScpiTimeoutError(f"Timeout sending: {data!r}") from e
         except OSError as e:
@@ -108,6 +225,7 @@ class TcpTransport(Transport):
     def send_raw(self, data: bytes) -> None:
         if self._socket is None:
             raise ScpiConnectionError("Not connected")
+        self._apply_timeout(self._socket, None)
         try:
             self._socket.sendall(data)
         except socket.timeout as e:
@@ -116,31 +234,40 @@ class TcpTransport(Transport):
             self._socket = None
             raise ScpiConnectionError(f"Raw send failed: {e}") from e
 
+    def send_many(self, commands: Iterable[str]) -> None:
+        """Send several commands with a single sendall()."""
+        payload = "".join(c if c.endswith("\n") else c + "\n" for c in commands)
+        if payload:
+            self.send_raw(payload.encode("ascii"))
+
     def receive(self, timeout: float | None = None) -> str:
+        return self.receive_bytes(timeout).decode("ascii", errors="replace")
+
+    def receive_bytes(self, timeout: float | None = None) -> bytes:
         if self._socket is None:
             raise ScpiConnectionError("Not connected")
-        prev_timeout = self._socket.gettimeout()
-        if timeout is not None:
-            self._socket.settimeout(timeout)
+        self._apply_timeout(self._socket, timeout)
         try:
-            return self._read_until_newline().strip()
+            return self._consume_line(self._socket).strip()
         except socket.timeout as e:
             raise ScpiTimeoutError("Timeout waiting for response") from e
         except OSError as e:
             self._socket = None
             raise ScpiConnectionError(f"Receive failed: {e}") from e
-        finally:
-            if timeout is not None and self._socket is not None:
-                self._socket.settimeout(prev_timeout)
 
     def receive_raw(self, count: int, timeout: float | None = None) -> bytes:
+        buf = bytearray(count)
+        self.receive_into(memoryview(buf), count, timeout=timeout)
+        return bytes(buf)
+
+    def receive_into(
+        self, buf: memoryview, count: int, timeout: float | None = None
+    ) -> int:
         if self._socket is None:
             raise ScpiConnectionError("Not connected")
-        prev_timeout = self._socket.gettimeout()
-        if timeout is not None:
-            self._socket.settimeout(timeout)
+        self._apply_timeout(self._socket, timeout)
         try:
-            return self._read_bytes(count)
+            self._read_into(self._socket, buf, count)
         except socket.timeout as e:
             raise ScpiTimeoutError(
                 f"Timeout reading {count} raw bytes"
@@ -148,26 +275,69 @@ class TcpTransport(Transport):
         except OSError as e:
             self._socket = None
             raise ScpiConnectionError(f"Raw receive failed: {e}") from e
-        finally:
-            if timeout is not None and self._socket is not None:
-                self._socket.settimeout(prev_timeout)
+        return count
+
+    def flush_input(self) -> None:
+        """Discard any unread data, buffered or already received by the OS."""
+        self._rxbuf.clear()
+        if self._socket is None:
+            return
+        self._apply_timeout(self._socket, 0.0)
+        try:
+            while True:
+                if self._socket.recv_into(self._scratch) == 0:
+                    # Peer closed the connection; nothing left to reuse.
+                    self.disconnect()
+                    return
+        except BlockingIOError:
+            pass
+        except OSError:
+            self.disconnect()
 
-    def _read_until_newline(self) -> str:
-        buf = bytearray()
+    def _consume_line(self, sock: socket.socket) -> bytes:
+        """Return the next line (without its newline) from the receive buffer.
+
+        Anything received after the newline stays buffered for the next read.
+        """
+        rxbuf = self._rxbuf
+        scanned = 0
         while True:
-            chunk = self._socket.recv(4096)
-            if not chunk:
-                raise ScpiConnectionError("Connection closed by instrument")
-            buf.extend(chunk)
-            if b"\n" in buf:
-                break
-        return buf.decode("ascii", errors="replace")
-
-    def _read_bytes(self, count: int) -> bytes:
-        buf = bytearray()
-        while len(buf) < count:
-            chunk = self._socket.recv(min(count - len(buf), 65536))
-            if not chunk:
+            idx = rxbuf.find(b"\n", scanned)
+            if idx >= 0:
+                line = bytes(rxbuf[:idx])
+                del rxbuf[:idx + 1]
+                return line
+            scanned = len(rxbuf)
+            self._recv_chunk(sock)
+
+    def _pop_line(self) -> bytes | None:
+        """Return the next buffered line, or None if none is complete yet."""
+        idx = self._rxbuf.find(b"\n")
+        if idx < 0:
+            return None
+        line = bytes(self._rxbuf[:idx])
+        del self._rxbuf[:idx + 1]
+        return line
+
+    def _recv_chunk(self, sock: socket.socket) -> None:
+        """Append one recv() worth of data to the receive buffer."""
+        n = sock.recv_into(self._scratch)
+        if n == 0:
+            raise ScpiConnectionError("Connection closed by instrument")
+        self._rxbuf += memoryview(self._scratch)[:n]
+
+    def _read_into(self, sock: socket.socket, buf: memoryview, count: int) -> None:
+        view = memoryview(buf).cast("B")
+        if len(view) < count:
+            raise ValueError(
+                f"Buffer of {len(view)} bytes cannot hold {count} bytes"
+            )
+        got = min(count, len(self._rxbuf))
+        if got:
+            view[:got] = self._rxbuf[:got]
+            del self._rxbuf[:got]
+        while got < count:
+            n = sock.recv_into(view[got:count])
+            if n == 0:
                 raise ScpiConnectionError("Connection closed by instrument")
-            buf.extend(chunk)
-        return bytes(buf)
+            got += n
@@ -0,0 +1,141 @@
+import asyncio
+import pytest
+
+from scpi_core import (
+    AsyncTcpTransport,
+    AsyncScpiDevice,
+    ScpiConnectionError,
+    ScpiTimeoutError,
+)
+
+
+async def start_server(responses, delay=0.0):
+    """Start an asyncio server that answers each line from `responses`."""
+
+    async def handle(reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                reply = responses.get(line.strip().decode("ascii"))
+                if reply is None:
+                    continue
+                await asyncio.sleep(delay)
+                writer.write(reply)
+                await writer.drain()
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, port
+
+
+class TestAsyncTransport:
+    def test_send_and_receive(self):
+        async def run():
+            server, port = await start_server({"HELLO": b"REPLY\n"})
+            async with server:
+                tp = AsyncTcpTransport("127.0.0.1", port, timeout=2.0)
+                await tp.connect()
+                assert tp.is_connected()
+                await tp.send("HELLO")
+                assert await tp.receive() == "REPLY"
+                await tp.disconnect()
+                assert not tp.is_connected()
+
+        asyncio.run(run())
+
+    def test_receive_raw(self):
+        async def run():
+            server, port = await start_server({"WAV:DATA?": b"\x00\x01\x02"})
+            async with server:
+                tp = AsyncTcpTransport("127.0.0.1", port, timeout=2.0)
+                await tp.connect()
+                await tp.send("WAV:DATA?")
+                assert await tp.receive_raw(3) == b"\x00\x01\x02"
+                await tp.disconnect()
+
+        asyncio.run(run())
+
+    def test_receive_timeout(self):
+        async def run():
+            server, port = await start_server({})
+            async with server:
+                tp = AsyncTcpTransport("127.0.0.1", port, timeout=2.0)
+                await tp.connect()
+                await tp.send("HELLO")
+                with pytest.raises(ScpiTimeoutError):
+                    await tp.receive(timeout=0.2)
+                await tp.disconnect()
+
+        asyncio.run(run())
+
+    def test_connect_refused(self):
+        tp = AsyncTcpTransport("127.0.0.1", 1, timeout=1.0)
+        with pytest.raises(ScpiConnectionError):
+            asyncio.run(tp.connect())
+
+    def test_send_when_disconnected_raises(self):
+        tp = AsyncTcpTransport("127.0.0.1", 1, timeout=1.0)
+        with pytest.raises(ScpiConnectionError):
+            asyncio.run(tp.send("HELLO"))
+
+    def test_receive_error_closes_writer(self):
+        async def run():
+            server, port = await start_server({})
+            async with server:
+                tp = AsyncTcpTransport("127.0.0.1", port, timeout=2.0)
+                await tp.connect()
+                writer = tp._writer
+
+                async def fail():
+                    raise ConnectionResetError("reset")
+
+                tp._reader.readuntil = lambda sep: fail()
+                with pytest.raises(ScpiConnectionError):
+                    await tp.receive()
+                assert not tp.is_connected()
+                assert writer.is_closing()
+
+        asyncio.run(run())
+
+
+class TestAsyncDevice:
+    def test_query_float(self):
+        async def run():
+            server, port = await start_server({":CHAN1:SCAL?": b"1.5\n"})
+            async with server:
+                tp = AsyncTcpTransport("127.0.0.1", port, timeout=2.0)
+                async with AsyncScpiDevice(tp) as dev:
+                    assert await dev.query_float(":CHAN1:SCAL?") == 1.5
+                assert not dev.is_connected()
+
+        asyncio.run(run())
+
+    def test_gather_overlaps_instruments(self):
+        async def run():
+            servers = [
+                await start_server({"*IDN?": f"DEV{i}\n".encode()}, delay=0.3)
+                for i in range(3)
+            ]
+            devices = [
+                AsyncScpiDevice(AsyncTcpTransport("127.0.0.1", port, timeout=2.0))
+                for _, port in servers
+            ]
+            for dev in devices:
+                await dev.connect()
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            idns = await asyncio.gather(*(dev.idn() for dev in devices))
+            elapsed = loop.time() - start
+            for dev in devices:
+                await dev.disconnect()
+            for server, _ in servers:
+                server.close()
+                await server.wait_closed()
+            assert idns == ["DEV0", "DEV1", "DEV2"]
+            assert elapsed < 0.8
+
+        asyncio.run(run())
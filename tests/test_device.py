@@ -13,6 +13,7 @@ class MockTransport(Transport):
         self._sent = []
         self._responses = {}
         self._response_queue = {}
+        self._raw = bytearray()
 
     def connect(self):
         self._connected = True
@@ -34,6 +35,14 @@ class MockTransport(Transport):
             return self._responses[cmd]
         return ""
 
+    def receive_raw(self, count: int, timeout: float | None = None) -> bytes:
+        data = bytes(self._raw[:count])
+        del self._raw[:count]
+        return data
+
+    def set_raw(self, data: bytes):
+        self._raw[:] = data
+
     def set_response(self, query: str, response: str):
         self._responses[query] = response
 
@@ -69,12 +78,28 @@ class TestCommand:
         device.command(":STOP")
         assert mock_transport.sent == [":RUN", ":STOP"]
 
+    def test_compile_command(self, device, mock_transport):
+        set_scale = device.compile_command(":CHAN%d:SCAL %g")
+        set_scale(1, 0.5)
+        set_scale(2, 2)
+        assert mock_transport.sent == [":CHAN1:SCAL 0.5", ":CHAN2:SCAL 2"]
+
+    def test_commands_batch(self, device, mock_transport):
+        device.commands(["*CLS", "*RST", ":RUN"])
+        assert mock_transport.sent == ["*CLS", "*RST", ":RUN"]
+
 
 class TestQuery:
     def test_query_returns_response(self, device, mock_transport):
         mock_transport.set_response("*IDN?", "RIGOL,MSO5074")
         assert device.query("*IDN?") == "RIGOL,MSO5074"
 
+    def test_pipeline(self, device, mock_transport):
+        mock_transport.queue_response(":MEAS:VOLT?", "1.0")
+        mock_transport.queue_response(":MEAS:VOLT?", "2.0")
+        assert device.pipeline([":MEAS:VOLT?", ":MEAS:VOLT?"]) == ["1.0", "2.0"]
+        assert mock_transport.sent == [":MEAS:VOLT?", ":MEAS:VOLT?"]
+
     def test_query_float(self, device, mock_transport):
         mock_transport.set_response(":CHAN1:SCAL?", "1.5")
         assert device.query_float(":CHAN1:SCAL?") == 1.5
@@ -105,12 +130,53 @@ class TestQuery:
         mock_transport.set_response(":DVM:ENAB?", "ON")
         assert device.query_bool(":DVM:ENAB?") is True
 
+    def test_query_bool_lowercase(self, device, mock_transport):
+        mock_transport.set_response(":OUTP?", "off")
+        assert device.query_bool(":OUTP?") is False
+
+    def test_query_bool_true_false(self, device, mock_transport):
+        mock_transport.set_response(":OUTP?", "TRUE")
+        assert device.query_bool(":OUTP?") is True
+
+    def test_query_bool_unstripped_response(self, device, mock_transport):
+        mock_transport.set_response(":DVM:ENAB?", "ON\r\n")
+        assert device.query_bool(":DVM:ENAB?") is True
+
     def test_query_bool_bad_response(self, device, mock_transport):
         mock_transport.set_response(":CHAN1:DISP?", "MAYBE")
         with pytest.raises(ScpiProtocolError):
             device.query_bool(":CHAN1:DISP?")
 
 
+class TestBlockData:
+    def test_query_block_u1(self, device, mock_transport):
+        np = pytest.importorskip("numpy")
+        mock_transport.set_raw(b"#15\x00\x01\x02\x03\xff\n")
+        arr = device.query_block(":WAV:DATA?")
+        assert arr.dtype == np.uint8
+        assert arr.tolist() == [0, 1, 2, 3, 255]
+        assert mock_transport.last_sent() == ":WAV:DATA?"
+
+    def test_query_block_big_endian_i2(self, device, mock_transport):
+        pytest.importorskip("numpy")
+        mock_transport.set_raw(b"#14\x00\x01\xff\xfe\n")
+        arr = device.query_block(":WAV:DATA?", dtype=">i2")
+        assert arr.tolist() == [1, -2]
+        assert arr.flags.writeable
+
+    def test_query_block_bad_header(self, device, mock_transport):
+        pytest.importorskip("numpy")
+        mock_transport.set_raw(b"1.0,2.0\n")
+        with pytest.raises(ScpiProtocolError):
+            device.query_block(":WAV:DATA?")
+
+    def test_query_block_odd_length(self, device, mock_transport):
+        pytest.importorskip("numpy")
+        mock_transport.set_raw(b"#13\x00\x01\x02\n")
+        with pytest.raises(ScpiProtocolError):
+            device.query_block(":WAV:DATA?", dtype=">i2")
+
+
 class TestIEEE488:
     def test_idn(self, device, mock_transport):
         mock_transport.set_response("*IDN?", "RIGOL,MSO5074,SN123,1.0")
@@ -128,6 +194,10 @@ class TestIEEE488:
         mock_transport.set_response("*OPC?", "1")
         assert device.opc() is True
 
+    def test_opc_unstripped_response(self, device, mock_transport):
+        mock_transport.set_response("*OPC?", "1\n")
+        assert device.opc() is True
+
     def test_wait(self, device, mock_transport):
         device.wait()
         assert mock_transport.last_sent() == "*WAI"
@@ -138,10 +208,20 @@ class TestIEEE488:
         device.recall_state(3)
         assert mock_transport.last_sent() == "*RCL 3"
 
+    def test_save_recall_state_string_slot(self, device, mock_transport):
+        device.save_state("3")
+        assert mock_transport.last_sent() == "*SAV 3"
+        device.recall_state("3")
+        assert mock_transport.last_sent() == "*RCL 3"
+
     def test_check_error_none(self, device, mock_transport):
         mock_transport.set_response(":SYST:ERR?", "0,No error")
         assert device.check_error() is None
 
+    def test_check_error_none_signed(self, device, mock_transport):
+        mock_transport.set_response(":SYST:ERR?", '+0,"No error"')
+        assert device.check_error() is None
+
     def test_check_error_present(self, device, mock_transport):
         mock_transport.set_response(":SYST:ERR?", "-100,Command error")
         assert device.check_error() == "-100,Command error"
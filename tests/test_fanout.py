@@ -0,0 +1,89 @@
+import time
+
+import pytest
+
+from scpi_core import ScpiDevice, ScpiTimeoutError, TcpTransport, broadcast
+from tests.test_device import MockTransport
+from tests.test_transport import make_server
+
+
+def delayed_reply(reply, delay):
+    def handler(srv):
+        conn, _ = srv.accept()
+        data = b""
+        while b"\n" not in data:
+            data += conn.recv(1024)
+        time.sleep(delay)
+        conn.sendall(reply)
+        time.sleep(0.5)
+        conn.close()
+        srv.close()
+
+    return handler
+
+
+class SlowTransport(MockTransport):
+    """Mock transport that takes ``delay`` seconds to answer."""
+
+    def __init__(self, delay):
+        super().__init__()
+        self.delay = delay
+        self.timeouts = []
+
+    def receive(self, timeout=None):
+        self.timeouts.append(timeout)
+        time.sleep(self.delay)
+        return super().receive(timeout)
+
+
+def tcp_device(port):
+    return ScpiDevice(TcpTransport("127.0.0.1", port, timeout=2.0))
+
+
+class TestBroadcast:
+    def test_responses_in_device_order(self):
+        delays = [0.3, 0.1, 0.2]
+        devices = []
+        for i, delay in enumerate(delays):
+            _, port, _ = make_server(delayed_reply(b"DEV%d\n" % i, delay))
+            devices.append(tcp_device(port))
+        start = time.monotonic()
+        assert broadcast(devices, "*IDN?") == ["DEV0", "DEV1", "DEV2"]
+        assert time.monotonic() - start < 0.6
+        for dev in devices:
+            dev.disconnect()
+
+    def test_mixed_transports(self):
+        _, port, _ = make_server(delayed_reply(b"TCP\n", 0.0))
+        mock = MockTransport()
+        mock.set_response("*IDN?", "MOCK")
+        devices = [ScpiDevice(mock), tcp_device(port)]
+        assert broadcast(devices, "*IDN?") == ["MOCK", "TCP"]
+        devices[1].disconnect()
+
+    def test_timeout(self):
+        _, port, _ = make_server(delayed_reply(b"LATE\n", 1.0))
+        dev = tcp_device(port)
+        with pytest.raises(ScpiTimeoutError):
+            broadcast([dev], "*IDN?", timeout=0.2)
+        dev.disconnect()
+
+    def test_timeout_includes_non_tcp_devices(self):
+        _, port, _ = make_server(delayed_reply(b"LATE\n", 1.0))
+        slow = SlowTransport(0.2)
+        devices = [ScpiDevice(slow), tcp_device(port)]
+        start = time.monotonic()
+        with pytest.raises(ScpiTimeoutError):
+            broadcast(devices, "*IDN?", timeout=0.4)
+        # The TCP wait only gets what the slow device left over.
+        assert time.monotonic() - start < 0.55
+        assert 0 < slow.timeouts[0] <= 0.4
+        devices[1].disconnect()
+
+    def test_shared_tcp_transport_rejected(self):
+        _, port, _ = make_server(delayed_reply(b"TCP\n", 0.0))
+        dev = tcp_device(port)
+        with pytest.raises(ValueError, match="same TcpTransport"):
+            broadcast([dev, ScpiDevice(dev.transport)], "*IDN?")
+        assert dev.transport._rxbuf == b""
+        dev.disconnect()
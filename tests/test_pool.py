@@ -0,0 +1,117 @@
+import threading
+import time
+
+from scpi_core import ScpiDevice, TcpTransportPool
+from tests.test_transport import make_server
+
+
+def echo_handler(accepts):
+    """Serve `accepts` connections, answering every line with b"OK<n>"."""
+
+    def handler(srv):
+        for n in range(accepts):
+            conn, _ = srv.accept()
+            buf = b""
+            while True:
+                try:
+                    chunk = conn.recv(1024)
+                except OSError:
+                    break
+                if not chunk:
+                    break
+                buf += chunk
+                while b"\n" in buf:
+                    _, buf = buf.split(b"\n", 1)
+                    conn.sendall(b"OK%d\n" % n)
+            conn.close()
+        srv.close()
+
+    return handler
+
+
+class TestTcpTransportPool:
+    def test_reuses_released_transport(self):
+        srv, port, _ = make_server(echo_handler(1))
+        pool = TcpTransportPool(idle_ttl=5.0)
+        tp = pool.get("127.0.0.1", port, timeout=2.0)
+        tp.send("A")
+        assert tp.receive() == "OK0"
+        pool.release(tp)
+        again = pool.get("127.0.0.1", port, timeout=2.0)
+        assert again is tp
+        again.send("B")
+        assert again.receive() == "OK0"
+        pool.release(again)
+        pool.close()
+        assert not tp.is_connected()
+
+    def test_expired_transport_is_reaped(self):
+        srv, port, _ = make_server(echo_handler(2))
+        pool = TcpTransportPool(idle_ttl=0.05)
+        tp = pool.get("127.0.0.1", port, timeout=2.0)
+        pool.release(tp)
+        time.sleep(0.1)
+        pool.reap()
+        assert not tp.is_connected()
+        fresh = pool.get("127.0.0.1", port, timeout=2.0)
+        assert fresh is not tp
+        fresh.send("A")
+        assert fresh.receive() == "OK1"
+        pool.close()
+
+    def test_connection_closed_while_pooled(self):
+        released = threading.Event()
+        closed = threading.Event()
+
+        def handler(srv):
+            conn, _ = srv.accept()
+            conn.recv(1024)
+            conn.sendall(b"FIRST\n")
+            released.wait(2.0)
+            conn.close()
+            closed.set()
+            conn, _ = srv.accept()
+            conn.recv(1024)
+            conn.sendall(b"SECOND\n")
+            conn.close()
+            srv.close()
+
+        srv, port, _ = make_server(handler)
+        pool = TcpTransportPool(idle_ttl=5.0)
+        tp = pool.get("127.0.0.1", port, timeout=2.0)
+        tp.send("A")
+        assert tp.receive() == "FIRST"
+        pool.release(tp)
+        released.set()
+        closed.wait(2.0)
+        time.sleep(0.1)
+        fresh = pool.get("127.0.0.1", port, timeout=2.0)
+        assert fresh is not tp
+        assert not tp.is_connected()
+        fresh.send("B")
+        assert fresh.receive() == "SECOND"
+        fresh.disconnect()
+        pool.close()
+
+    def test_release_discards_unread_data(self):
+        srv, port, _ = make_server(echo_handler(1))
+        pool = TcpTransportPool(idle_ttl=5.0)
+        tp = pool.get("127.0.0.1", port, timeout=2.0)
+        tp.send("UNREAD")
+        time.sleep(0.1)
+        pool.release(tp)
+        tp = pool.get("127.0.0.1", port, timeout=2.0)
+        tp.send("A")
+        assert tp.receive() == "OK0"
+        pool.close()
+
+    def test_device_from_pool(self):
+        srv, port, _ = make_server(echo_handler(1))
+        pool = TcpTransportPool(idle_ttl=5.0)
+        with ScpiDevice.from_pool("127.0.0.1", port, timeout=2.0, pool=pool) as dev:
+            assert dev.query("*IDN?") == "OK0"
+            first = dev.transport
+        assert first.is_connected()
+        with ScpiDevice.from_pool("127.0.0.1", port, timeout=2.0, pool=pool) as dev:
+            assert dev.transport is first
+        pool.close()
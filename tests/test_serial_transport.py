@@ -0,0 +1,258 @@
+import threading
+import time
+import types
+
+import pytest
+
+from scpi_core import ScpiConnectionError, ScpiTimeoutError
+from scpi_core import serial_transport
+from scpi_core.serial_transport import SerialTransport
+
+
+class FakeSerialException(Exception):
+    pass
+
+
+class FakeSerial:
+    """In-memory stand-in for serial.Serial."""
+
+    instances = []
+
+    def __init__(self, port, baudrate, timeout):
+        self.port = port
+        self.baudrate = baudrate
+        self._timeout = timeout
+        self.timeout_sets = 0
+        self.is_open = True
+        self.written = bytearray()
+        self.incoming = bytearray()
+        self.reads = []
+        self.low_latency = False
+        self._cond = threading.Condition()
+        FakeSerial.instances.append(self)
+
+    @property
+    def timeout(self):
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value):
+        # pyserial reconfigures the port on every assignment.
+        self.timeout_sets += 1
+        self._timeout = value
+
+    @property
+    def in_waiting(self):
+        return len(self.incoming)
+
+    def feed(self, data):
+        with self._cond:
+            self.incoming += data
+            self._cond.notify_all()
+
+    def read(self, size=1):
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self.incoming or not self.is_open, timeout=self.timeout
+            )
+            if not self.is_open:
+                raise FakeSerialException("port closed")
+            self.reads.append(size)
+            data = bytes(self.incoming[:size])
+            del self.incoming[:size]
+            return data
+
+    def write(self, data):
+        self.written += data
+        return len(data)
+
+    def set_low_latency_mode(self, enabled):
+        self.low_latency = enabled
+
+    def set_buffer_size(self, rx_size, tx_size):
+        self.buffer_size = (rx_size, tx_size)
+
+    def reset_input_buffer(self):
+        self.incoming.clear()
+
+    def close(self):
+        with self._cond:
+            self.is_open = False
+            self._cond.notify_all()
+
+
+@pytest.fixture
+def fake_serial(monkeypatch):
+    FakeSerial.instances = []
+    module = types.SimpleNamespace(
+        Serial=FakeSerial, SerialException=FakeSerialException
+    )
+    monkeypatch.setattr(serial_transport, "serial", module)
+    return FakeSerial
+
+
+@pytest.fixture
+def transport(fake_serial):
+    tp = SerialTransport("/dev/ttyUSB0", timeout=1.0)
+    tp.connect()
+    return tp
+
+
+class TestSerialConnect:
+    def test_connect_disconnect(self, transport, fake_serial):
+        assert transport.is_connected()
+        port = fake_serial.instances[0]
+        assert port.port == "/dev/ttyUSB0"
+        transport.disconnect()
+        assert not transport.is_connected()
+        assert not port.is_open
+
+    def test_low_latency_enabled(self, transport, fake_serial):
+        assert fake_serial.instances[0].low_latency is True
+
+    def test_low_latency_opt_out(self, fake_serial):
+        tp = SerialTransport("/dev/ttyUSB0", low_latency=False)
+        tp.connect()
+        assert fake_serial.instances[0].low_latency is False
+
+    def test_ftdi_latency_timer_on_linux(
+        self, fake_serial, monkeypatch, tmp_path
+    ):
+        timer = tmp_path / "ttyUSB0" / "latency_timer"
+        timer.parent.mkdir()
+        timer.write_text("16")
+        monkeypatch.setattr(serial_transport.sys, "platform", "linux")
+        monkeypatch.setattr(serial_transport, "_USB_SERIAL_SYSFS", str(tmp_path))
+        SerialTransport("/dev/ttyUSB0").connect()
+        assert timer.read_text() == "1"
+
+    def test_missing_latency_timer_is_ignored(
+        self, fake_serial, monkeypatch, tmp_path
+    ):
+        monkeypatch.setattr(serial_transport.sys, "platform", "linux")
+        monkeypatch.setattr(serial_transport, "_USB_SERIAL_SYSFS", str(tmp_path))
+        tp = SerialTransport("/dev/ttyACM0")
+        tp.connect()
+        assert tp.is_connected()
+
+    def test_buffer_size_on_windows(self, fake_serial, monkeypatch):
+        monkeypatch.setattr(serial_transport.sys, "platform", "win32")
+        SerialTransport("COM3").connect()
+        assert fake_serial.instances[0].buffer_size == (65536, 65536)
+
+
+class TestSerialSendReceive:
+    def test_send_appends_terminator(self, transport, fake_serial):
+        transport.send("*IDN?")
+        assert fake_serial.instances[0].written == b"*IDN?\n"
+
+    def test_receive_reads_in_bulk(self, transport, fake_serial):
+        port = fake_serial.instances[0]
+        port.incoming += b"RIGOL,MSO5074\r\n"
+        assert transport.receive() == "RIGOL,MSO5074"
+        assert port.reads == [15]
+
+    def test_receive_keeps_bytes_after_newline(self, transport, fake_serial):
+        fake_serial.instances[0].incoming += b"FIRST\nSECOND\n#"
+        assert transport.receive() == "FIRST"
+        assert transport.receive() == "SECOND"
+        assert transport.receive_raw(1) == b"#"
+
+    def test_receive_raw_drains_buffer_first(self, transport, fake_serial):
+        fake_serial.instances[0].incoming += b"HDR\n\x00\x01\x02\x03"
+        assert transport.receive() == "HDR"
+        assert transport.receive_raw(4) == b"\x00\x01\x02\x03"
+
+    def test_receive_timeout(self, transport):
+        with pytest.raises(ScpiTimeoutError):
+            transport.receive(timeout=0.1)
+
+    def test_receive_timeout_bounds_whole_line(self, transport, fake_serial):
+        port = fake_serial.instances[0]
+        # A partial response arriving just before the deadline must not
+        # restart a full-length blocking read.
+        feeder = threading.Timer(0.3, port.feed, args=(b"PARTIAL",))
+        feeder.start()
+        start = time.monotonic()
+        with pytest.raises(ScpiTimeoutError):
+            transport.receive(timeout=0.4)
+        assert time.monotonic() - start < 0.6
+        feeder.join()
+
+    def test_trickled_lines_do_not_reconfigure_port(
+        self, transport, fake_serial
+    ):
+        port = fake_serial.instances[0]
+
+        def trickle():
+            for byte in b"OK1\nOK2\nOK3\n":
+                time.sleep(0.002)
+                port.feed(bytes([byte]))
+
+        feeder = threading.Thread(target=trickle)
+        feeder.start()
+        assert [transport.receive() for _ in range(3)] == ["OK1", "OK2", "OK3"]
+        feeder.join()
+        assert port.timeout_sets == 0
+
+    def test_receive_raw_short_read(self, transport, fake_serial):
+        fake_serial.instances[0].incoming += b"\x00\x01"
+        with pytest.raises(ScpiTimeoutError):
+            transport.receive_raw(4, timeout=0.1)
+
+    def test_receive_when_disconnected_raises(self, fake_serial):
+        tp = SerialTransport("/dev/ttyUSB0")
+        with pytest.raises(ScpiConnectionError):
+            tp.receive()
+
+    def test_flush_input_clears_buffer(self, transport, fake_serial):
+        fake_serial.instances[0].incoming += b"STALE\nMORE"
+        transport.receive()
+        transport.flush_input()
+        fake_serial.instances[0].incoming += b"FRESH\n"
+        assert transport.receive() == "FRESH"
+
+
+class TestSerialThreadedReader:
+    @pytest.fixture
+    def threaded(self, fake_serial):
+        tp = SerialTransport("/dev/ttyACM0", timeout=1.0, threaded=True)
+        tp.connect()
+        yield tp
+        tp.disconnect()
+
+    def test_receive_lines(self, threaded, fake_serial):
+        port = fake_serial.instances[0]
+        port.feed(b"ONE\nTW")
+        assert threaded.receive() == "ONE"
+        port.feed(b"O\n")
+        assert threaded.receive() == "TWO"
+
+    def test_receive_raw(self, threaded, fake_serial):
+        port = fake_serial.instances[0]
+        port.feed(b"\x00\x01")
+        port.feed(b"\x02\x03\n")
+        assert threaded.receive_raw(4) == b"\x00\x01\x02\x03"
+        assert threaded.receive() == ""
+
+    def test_receive_timeout(self, threaded):
+        with pytest.raises(ScpiTimeoutError):
+            threaded.receive(timeout=0.1)
+
+    def test_disconnect_stops_reader(self, threaded):
+        reader = threaded._reader
+        assert reader.is_alive()
+        threaded.disconnect()
+        assert not reader.is_alive()
+        assert not threaded.is_connected()
+
+    def test_reader_error_surfaces(self, threaded, fake_serial):
+        port = fake_serial.instances[0]
+        with port._cond:
+            port.is_open = False
+            port._cond.notify_all()
+        with pytest.raises(ScpiConnectionError):
+            threaded.receive(timeout=0.5)
+        assert not threaded.is_connected()
+        with pytest.raises(ScpiConnectionError):
+            threaded.receive(timeout=0.5)
@@ -33,6 +33,39 @@ class TestTcpConnect:
         tp.disconnect()
         assert not tp.is_connected()
 
+    def test_socket_options(self):
+        def handler(srv):
+            conn, _ = srv.accept()
+            time.sleep(0.5)
+            conn.close()
+            srv.close()
+
+        srv, port, _ = make_server(handler)
+        tp = TcpTransport("127.0.0.1", port, timeout=2.0)
+        tp.connect()
+        sock = tp._socket
+        assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+        assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+        tp.disconnect()
+
+    def test_socket_options_disabled(self):
+        def handler(srv):
+            conn, _ = srv.accept()
+            time.sleep(0.5)
+            conn.close()
+            srv.close()
+
+        srv, port, _ = make_server(handler)
+        tp = TcpTransport(
+            "127.0.0.1", port, timeout=2.0,
+            nodelay=False, rcvbuf=None, sndbuf=None, keepalive=False,
+        )
+        tp.connect()
+        sock = tp._socket
+        assert not sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+        assert not sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+        tp.disconnect()
+
     def test_connect_refused(self):
         tp = TcpTransport("127.0.0.1", 1, timeout=1.0)
         with pytest.raises(ScpiConnectionError):
@@ -114,6 +147,27 @@ class TestTcpSendReceive:
         tp.disconnect()
         assert received[0] == b"TEST\n"
 
+    def test_send_many_single_write(self):
+        received = []
+
+        def handler(srv):
+            conn, _ = srv.accept()
+            data = b""
+            while data.count(b"\n") < 3:
+                data += conn.recv(1024)
+            received.append(data)
+            conn.sendall(b"OK\n")
+            conn.close()
+            srv.close()
+
+        srv, port, _ = make_server(handler)
+        tp = TcpTransport("127.0.0.1", port, timeout=2.0)
+        tp.connect()
+        tp.send_many(["*CLS", "*RST\n", ":RUN"])
+        tp.receive()
+        tp.disconnect()
+        assert received[0] == b"*CLS\n*RST\n:RUN\n"
+
     def test_receive_timeout(self):
         def handler(srv):
             conn, _ = srv.accept()
@@ -130,6 +184,26 @@ class TestTcpSendReceive:
         tp.disconnect()
         srv.close()
 
+    def test_receive_timeout_is_per_call(self):
+        def handler(srv):
+            conn, _ = srv.accept()
+            data = b""
+            while b"\n" not in data:
+                data += conn.recv(1024)
+            conn.sendall(b"OK\n")
+            time.sleep(1)
+            conn.close()
+            srv.close()
+
+        srv, port, _ = make_server(handler)
+        tp = TcpTransport("127.0.0.1", port, timeout=2.0)
+        tp.connect()
+        tp.send("HELLO")
+        assert tp.receive(timeout=0.5) == "OK"
+        tp.send("AGAIN")
+        assert tp._socket.gettimeout() == 2.0
+        tp.disconnect()
+
     def test_send_when_disconnected_raises(self):
         tp = TcpTransport("127.0.0.1", 1, timeout=1.0)
         with pytest.raises(ScpiConnectionError):
@@ -154,6 +228,43 @@ class TestTcpSendReceive:
             tp.receive()
         tp.disconnect()
 
+    def test_receive_long_line(self):
+        payload = b"1.25," * 40000  # larger than the initial receive buffer
+
+        def handler(srv):
+            conn, _ = srv.accept()
+            data = b""
+            while b"\n" not in data:
+                data += conn.recv(1024)
+            conn.sendall(payload + b"\n")
+            conn.close()
+            srv.close()
+
+        srv, port, _ = make_server(handler)
+        tp = TcpTransport("127.0.0.1", port, timeout=2.0)
+        tp.connect()
+        tp.send("WAV:DATA?")
+        assert tp.receive() == payload.decode("ascii")
+        tp.disconnect()
+
+    def test_receive_keeps_bytes_after_newline(self):
+        def handler(srv):
+            conn, _ = srv.accept()
+            data = b""
+            while b"\n" not in data:
+                data += conn.recv(1024)
+            conn.sendall(b"FIRST\nSECOND\n")
+            conn.close()
+            srv.close()
+
+        srv, port, _ = make_server(handler)
+        tp = TcpTransport("127.0.0.1", port, timeout=2.0)
+        tp.connect()
+        tp.send("HELLO")
+        assert tp.receive() == "FIRST"
+        assert tp.receive() == "SECOND"
+        tp.disconnect()
+
 
 class TestTcpRawIO:
     def test_send_receive_raw(self):
@@ -174,6 +285,65 @@ class TestTcpRawIO:
         assert raw == b"\x00\x01\x02\x03\x04"
         tp.disconnect()
 
+    def test_receive_into(self):
+        def handler(srv):
+            conn, _ = srv.accept()
+            data = b""
+            while b"\n" not in data:
+                data += conn.recv(1024)
+            conn.sendall(b"AB\nCDEF")
+            conn.close()
+            srv.close()
+
+        srv, port, _ = make_server(handler)
+        tp = TcpTransport("127.0.0.1", port, timeout=2.0)
+        tp.connect()
+        tp.send("WAV:DATA?")
+        assert tp.receive() == "AB"
+        buf = bytearray(6)
+        assert tp.receive_into(memoryview(buf), 4) == 4
+        assert buf == b"CDEF\x00\x00"
+        tp.disconnect()
+
+    def test_receive_into_short_buffer(self):
+        def handler(srv):
+            conn, _ = srv.accept()
+            data = b""
+            while b"\n" not in data:
+                data += conn.recv(1024)
+            conn.sendall(b"CDEF")
+            time.sleep(0.5)
+            conn.close()
+            srv.close()
+
+        srv, port, _ = make_server(handler)
+        tp = TcpTransport("127.0.0.1", port, timeout=2.0)
+        tp.connect()
+        tp.send("WAV:DATA?")
+        with pytest.raises(ValueError, match="cannot hold 4 bytes"):
+            tp.receive_into(memoryview(bytearray(2)), 4)
+        assert tp.is_connected()
+        assert tp.receive_raw(4) == b"CDEF"
+        tp.disconnect()
+
+    def test_receive_raw_after_pipelined_line(self):
+        def handler(srv):
+            conn, _ = srv.accept()
+            data = b""
+            while b"\n" not in data:
+                data += conn.recv(1024)
+            conn.sendall(b"HEADER\n\x00\x01\x02")
+            conn.close()
+            srv.close()
+
+        srv, port, _ = make_server(handler)
+        tp = TcpTransport("127.0.0.1", port, timeout=2.0)
+        tp.connect()
+        tp.send("WAV:DATA?")
+        assert tp.receive() == "HEADER"
+        assert tp.receive_raw(3) == b"\x00\x01\x02"
+        tp.disconnect()
+
 
 class TestTcpProperties:
     def test_host_port_timeout(self):